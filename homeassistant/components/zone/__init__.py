@@ -1,9 +1,11 @@
 """Support for the definition of zones."""
 from __future__ import annotations
 
+import bisect
 from collections.abc import Callable
 import logging
-from typing import Any, cast
+import math
+from typing import Any, NamedTuple, cast
 
 import voluptuous as vol
 
@@ -65,6 +67,9 @@ CREATE_FIELDS = {
     vol.Optional(CONF_ICON): cv.icon,
 }
 
+# Compiled once, shared by the YAML config and the storage collection
+ZONE_SCHEMA = vol.Schema(CREATE_FIELDS)
+
 
 UPDATE_FIELDS = {
     vol.Optional(CONF_NAME): cv.string,
@@ -77,18 +82,17 @@ UPDATE_FIELDS = {
 
 
 def empty_value(value: Any) -> Any:
-    """Test if the user has the default config value from adding "zone:"."""
+    """Replace the default config value from adding "zone:" with no zones."""
     if isinstance(value, dict) and len(value) == 0:
         return []
 
-    raise vol.Invalid("Not a default value")
+    return value
 
 
 CONFIG_SCHEMA = vol.Schema(
     {
-        vol.Optional(DOMAIN, default=[]): vol.Any(
-            vol.All(cv.ensure_list, [vol.Schema(CREATE_FIELDS)]),
-            empty_value,
+        vol.Optional(DOMAIN, default=[]): vol.All(
+            empty_value, cv.ensure_list, [ZONE_SCHEMA]
         )
     },
     extra=vol.ALLOW_EXTRA,
@@ -98,53 +102,243 @@ RELOAD_SERVICE_SCHEMA = vol.Schema({})
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
+DATA_ZONE_CACHE = "zone_cache"
+DATA_ZONE_ENTITIES = "zone_entities"
 
-@bind_hass
-def async_active_zone(
-    hass: HomeAssistant, latitude: float, longitude: float, radius: int = 0
-) -> State | None:
-    """Find the active zone for given latitude, longitude.
+PERSON_DOMAIN = "person"  # avoid circular import
 
-    This method must be run in the event loop.
+# Mean radius of the earth in meters
+EARTH_RADIUS = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+# Length in meters of a degree of latitude at the equator, the shortest one
+MIN_METERS_PER_LATITUDE_DEGREE = 110574
+
+# Where the fast distance may be used to skip zones, and the margin for its error
+FAST_DISTANCE_MAX_LATITUDE = 80
+FAST_DISTANCE_MAX_REACH = 100000
+FAST_DISTANCE_MARGIN = 0.99
+
+
+def _fast_distance(
+    lat1: float, lon1: float, lat2: float, lon2: float, cos_lat: float
+) -> float:
+    """Return the approximate distance in meters between two points.
+
+    Uses an equirectangular projection on a spherical earth, cos_lat being
+    the mean of the cosines of both latitudes. Up to FAST_DISTANCE_MAX_REACH
+    and FAST_DISTANCE_MAX_LATITUDE it is within about 0.6 percent of the
+    ellipsoidal distance, the worst case being north-south offsets near the
+    equator. The error grows to tens of percent for big distances near the
+    poles, so it is only used to skip zones that are clearly out of reach.
+    """
+    # Take the short way around the antimeridian
+    dlon = (lon2 - lon1 + 180) % 360 - 180
+    return math.hypot(dlon * cos_lat, lat2 - lat1) * METERS_PER_DEGREE
+
+
+class _ZoneArrays(NamedTuple):
+    """Struct-of-arrays view of the zones that can be active.
+
+    The zones are sorted by latitude to find the candidates for a point with
+    a binary search.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
+
+    entity_ids: tuple[str, ...]
+    latitudes: tuple[float, ...]
+    longitudes: tuple[float, ...]
+    cos_latitudes: tuple[float, ...]
+    radii: tuple[float, ...]
+    max_radius: float
+
+
+def _zone_record(zone: State) -> tuple[float, float, float] | None:
+    """Return latitude, longitude and radius of a zone that can be active.
+
+    Zones missing any of them are not usable and return None.
+    """
+    attrs = zone.attributes
+    if zone.state == STATE_UNAVAILABLE or attrs.get(ATTR_PASSIVE):
+        return None
+    latitude = attrs.get(ATTR_LATITUDE)
+    longitude = attrs.get(ATTR_LONGITUDE)
+    radius = attrs.get(ATTR_RADIUS)
+    if latitude is None or longitude is None or radius is None:
+        return None
+    return (latitude, longitude, radius)
+
+
+@callback
+def _async_get_zone_records(
+    hass: HomeAssistant,
+) -> dict[str, tuple[float, float, float]]:
+    """Collect the zones that can be active from the state machine."""
+    records = {}
+    for zone in hass.states.async_all(DOMAIN):
+        if (record := _zone_record(zone)) is not None:
+            records[zone.entity_id] = record
+    return records
+
+
+def _build_zone_arrays(records: dict[str, tuple[float, float, float]]) -> _ZoneArrays:
+    """Build the zone arrays from the zone records."""
+    entity_ids = tuple(sorted(records, key=lambda entity_id: records[entity_id][0]))
+    latitudes = tuple(records[entity_id][0] for entity_id in entity_ids)
+    radii = tuple(records[entity_id][2] for entity_id in entity_ids)
+    return _ZoneArrays(
+        entity_ids,
+        latitudes,
+        tuple(records[entity_id][1] for entity_id in entity_ids),
+        tuple(math.cos(math.radians(zone_lat)) for zone_lat in latitudes),
+        radii,
+        max(radii, default=0),
     )
 
-    min_dist = None
-    closest = None
 
-    for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
-            continue
+class _ZoneCache:
+    """Cache the zone arrays until the geometry of a zone changes.
 
-        zone_dist = distance(
-            latitude,
-            longitude,
-            zone.attributes[ATTR_LATITUDE],
-            zone.attributes[ATTR_LONGITUDE],
-        )
+    Zone entities update the cache as soon as they write or remove their
+    state. Zone states written by anyone else are picked up by a state
+    changed listener.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the zone cache."""
+        self._hass = hass
+        self._records = _async_get_zone_records(hass)
+        self._arrays: _ZoneArrays | None = None
+
+    @callback
+    def async_get_arrays(self) -> _ZoneArrays:
+        """Return the zone arrays, rebuilding them if needed."""
+        if self._arrays is None:
+            self._arrays = _build_zone_arrays(self._records)
+        return self._arrays
+
+    @callback
+    def async_resync(self) -> None:
+        """Collect the zone records from the state machine again."""
+        self._records = _async_get_zone_records(self._hass)
+        self._arrays = None
+
+    @callback
+    def async_update_zone(self, entity_id: str, zone: State | None) -> None:
+        """Update the record of a zone when it is added, removed or moved.
+
+        The state of a zone is the number of persons in it, which does not
+        affect its record.
+        """
+        record = None if zone is None else _zone_record(zone)
+
+        if record is None:
+            if self._records.pop(entity_id, None) is None:
+                return
+        elif self._records.get(entity_id) == record:
+            return
+        else:
+            self._records[entity_id] = record
+
+        self._arrays = None
 
-        if zone_dist is None:
+    @callback
+    def async_zone_state_changed(self, evt: Event) -> None:
+        """Update the record of a zone from the state machine."""
+        entity_id = evt.data["entity_id"]
+        # Newer states may have been written since the event was fired
+        self.async_update_zone(entity_id, self._hass.states.get(entity_id))
+
+
+def _active_zone_index(
+    zones: _ZoneArrays, latitude: float, longitude: float, radius: float
+) -> int | None:
+    """Return the index of the active zone in the zone arrays."""
+    cos_lat = math.cos(math.radians(latitude))
+    use_fast_distance = abs(latitude) <= FAST_DISTANCE_MAX_LATITUDE
+
+    # Prefer the closest zone, and the smallest one if equally close. Break
+    # remaining ties on the entity ID so the result does not depend on order.
+    best_key: tuple[float, float, str] = (math.inf, math.inf, "")
+    closest: int | None = None
+
+    # Only zones within reach of the biggest zone radius can contain the point
+    latitudes = zones.latitudes
+    reach = (radius + zones.max_radius) / MIN_METERS_PER_LATITUDE_DEGREE
+    start = bisect.bisect_left(latitudes, latitude - reach)
+    end = bisect.bisect_right(latitudes, latitude + reach, start)
+
+    for idx in range(start, end):
+        zone_lat = latitudes[idx]
+        zone_radius = zones.radii[idx]
+
+        # The latitude difference alone is a lower bound of the distance,
+        # skip zones that are out of reach or cannot beat the best one.
+        lat_dist = abs(zone_lat - latitude) * MIN_METERS_PER_LATITUDE_DEGREE
+        if lat_dist - radius >= zone_radius or lat_dist > best_key[0]:
             continue
 
-        within_zone = zone_dist - radius < zone.attributes[ATTR_RADIUS]
-        closer_zone = closest is None or zone_dist < min_dist  # type: ignore
-        smaller_zone = (
-            zone_dist == min_dist
-            and zone.attributes[ATTR_RADIUS]
-            < cast(State, closest).attributes[ATTR_RADIUS]
-        )
+        zone_lon = zones.longitudes[idx]
+
+        # Skip zones that are clearly out of reach before computing the
+        # exact distance, where the error of the fast distance is known.
+        if use_fast_distance and radius + zone_radius <= FAST_DISTANCE_MAX_REACH:
+            fast_dist = _fast_distance(
+                latitude,
+                longitude,
+                zone_lat,
+                zone_lon,
+                (cos_lat + zones.cos_latitudes[idx]) / 2,
+            )
+            if fast_dist * FAST_DISTANCE_MARGIN - radius >= zone_radius:
+                continue
+
+        zone_dist = distance(latitude, longitude, zone_lat, zone_lon)
+        if zone_dist is None or zone_dist - radius >= zone_radius:
+            continue
 
-        if within_zone and (closer_zone or smaller_zone):
-            min_dist = zone_dist
-            closest = zone
+        key = (zone_dist, zone_radius, zones.entity_ids[idx])
+        if key < best_key:
+            best_key = key
+            closest = idx
 
     return closest
 
 
+@bind_hass
+def async_active_zone(
+    hass: HomeAssistant, latitude: float, longitude: float, radius: int = 0
+) -> State | None:
+    """Find the active zone for given latitude, longitude.
+
+    This method must be run in the event loop.
+    """
+    zone_cache: _ZoneCache | None = hass.data.get(DATA_ZONE_CACHE)
+    if zone_cache is None:
+        zones = _build_zone_arrays(_async_get_zone_records(hass))
+    else:
+        zones = zone_cache.async_get_arrays()
+
+    closest = _active_zone_index(zones, latitude, longitude, radius)
+    if closest is None:
+        return None
+
+    active = hass.states.get(zones.entity_ids[closest])
+    if zone_cache is None or (
+        active is not None
+        and _zone_record(active)
+        == (zones.latitudes[closest], zones.longitudes[closest], zones.radii[closest])
+    ):
+        return active
+
+    # The zone state was changed by someone else and the listener did not see
+    # it yet, start over from the state machine.
+    zone_cache.async_resync()
+    zones = zone_cache.async_get_arrays()
+    closest = _active_zone_index(zones, latitude, longitude, radius)
+    if closest is None:
+        return None
+    return hass.states.get(zones.entity_ids[closest])
+
+
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
     """Test if given latitude, longitude is in given zone.
 
@@ -153,22 +347,20 @@ def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -
     if zone.state == STATE_UNAVAILABLE:
         return False
 
+    attrs = zone.attributes
     zone_dist = distance(
-        latitude,
-        longitude,
-        zone.attributes[ATTR_LATITUDE],
-        zone.attributes[ATTR_LONGITUDE],
+        latitude, longitude, attrs[ATTR_LATITUDE], attrs[ATTR_LONGITUDE]
     )
-
-    if zone_dist is None or zone.attributes[ATTR_RADIUS] is None:
+    zone_radius = attrs[ATTR_RADIUS]
+    if zone_dist is None or zone_radius is None:
         return False
-    return zone_dist - radius < cast(float, zone.attributes[ATTR_RADIUS])
+    return zone_dist - radius < cast(float, zone_radius)
 
 
 class ZoneStorageCollection(collection.StorageCollection):
     """Zone collection stored in storage."""
 
-    CREATE_SCHEMA = vol.Schema(CREATE_FIELDS)
+    CREATE_SCHEMA = ZONE_SCHEMA
     UPDATE_SCHEMA = vol.Schema(UPDATE_FIELDS)
 
     async def _process_create_data(self, data: dict) -> dict:
@@ -183,11 +375,40 @@ class ZoneStorageCollection(collection.StorageCollection):
     async def _update_data(self, data: dict, update_data: dict) -> dict:
         """Return a new updated data object."""
         update_data = self.UPDATE_SCHEMA(update_data)
-        return {**data, **update_data}
+        return data | update_data
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
+    zone_cache = hass.data[DATA_ZONE_CACHE] = _ZoneCache(hass)
+    event.async_track_state_change_filtered(
+        hass,
+        event.TrackStates(False, set(), {DOMAIN}),
+        zone_cache.async_zone_state_changed,
+    )
+
+    # Zone entities by object ID, which is the state of a person in the zone
+    zone_entities: dict[str, Zone] = {}
+    hass.data[DATA_ZONE_ENTITIES] = zone_entities
+
+    @callback
+    def person_state_changed(evt: Event) -> None:
+        """Update the zones a person left or entered."""
+        old_state = evt.data["old_state"]
+        new_state = evt.data["new_state"]
+        old_zone = zone_entities.get(old_state.state) if old_state else None
+        new_zone = zone_entities.get(new_state.state) if new_state else None
+        if old_zone is not None and old_zone is not new_zone:
+            old_zone.async_person_state_changed(evt)
+        if new_zone is not None:
+            new_zone.async_person_state_changed(evt)
+
+    event.async_track_state_change_filtered(
+        hass,
+        event.TrackStates(False, set(), {PERSON_DOMAIN}),
+        person_state_changed,
+    )
+
     component = entity_component.EntityComponent(_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
 
@@ -289,22 +510,20 @@ async def async_unload_entry(
 class Zone(entity.Entity):
     """Representation of a Zone."""
 
-    def __init__(self, config: dict) -> None:
+    def __init__(self, config: dict, editable: bool = True) -> None:
         """Initialize the zone."""
         self._config = config
-        self.editable = True
+        self.editable = editable
         self._attrs: dict | None = None
         self._remove_listener: Callable[[], None] | None = None
         self._generate_attrs()
         self._persons_in_zone: set[str] = set()
+        self._object_id: str | None = None
 
     @classmethod
     def from_yaml(cls, config: dict) -> Zone:
         """Return entity instance initialized from yaml storage."""
-        zone = cls(config)
-        zone.editable = False
-        zone._generate_attrs()
-        return zone
+        return cls(config, editable=False)
 
     @property
     def state(self) -> int:
@@ -345,36 +564,54 @@ class Zone(entity.Entity):
         self.async_write_ha_state()
 
     @callback
-    def _person_state_change_listener(self, evt: Event) -> None:
-        object_id = split_entity_id(self.entity_id)[1]
+    def async_person_state_changed(self, evt: Event) -> None:
+        """Handle a person entering or leaving the zone."""
         person_entity_id = evt.data["entity_id"]
-        cur_count = len(self._persons_in_zone)
-        if evt.data["new_state"] and evt.data["new_state"].state == object_id:
+        new_state = evt.data["new_state"]
+        if new_state and new_state.state == self._object_id:
+            if person_entity_id in self._persons_in_zone:
+                return
             self._persons_in_zone.add(person_entity_id)
-        elif person_entity_id in self._persons_in_zone:
+        else:
+            if person_entity_id not in self._persons_in_zone:
+                return
             self._persons_in_zone.remove(person_entity_id)
 
-        if len(self._persons_in_zone) != cur_count:
-            self.async_write_ha_state()
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine and the zone cache."""
+        super().async_write_ha_state()
+        zone_cache: _ZoneCache = self.hass.data[DATA_ZONE_CACHE]
+        zone_cache.async_update_zone(
+            self.entity_id, self.hass.states.get(self.entity_id)
+        )
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
-        person_domain = "person"  # avoid circular import
-        persons = self.hass.states.async_entity_ids(person_domain)
-        object_id = split_entity_id(self.entity_id)[1]
-        for person in persons:
-            state = self.hass.states.get(person)
-            if state and state.state == object_id:
-                self._persons_in_zone.add(person)
-
-        self.async_on_remove(
-            event.async_track_state_change_filtered(
-                self.hass,
-                event.TrackStates(False, set(), {person_domain}),
-                self._person_state_change_listener,
-            ).async_remove
-        )
+        # The entity ID is fixed while we are added, a rename re-adds us
+        object_id = self._object_id = split_entity_id(self.entity_id)[1]
+        self._persons_in_zone = {
+            person.entity_id
+            for person in self.hass.states.async_all(PERSON_DOMAIN)
+            if person.state == object_id
+        }
+
+        zone_entities: dict[str, Zone] = self.hass.data[DATA_ZONE_ENTITIES]
+        zone_entities[object_id] = self
+        zone_cache: _ZoneCache = self.hass.data[DATA_ZONE_CACHE]
+        entity_id = self.entity_id
+
+        @callback
+        def remove_zone_entity() -> None:
+            """Stop receiving person updates and drop the zone from the cache."""
+            if zone_entities.get(object_id) is self:
+                del zone_entities[object_id]
+            zone_cache.async_update_zone(entity_id, None)
+
+        self.async_on_remove(remove_zone_entity)
 
     @callback
     def _generate_attrs(self) -> None:
@@ -199,6 +199,53 @@ async def test_active_zone_prefers_smaller_zone_if_same_distance_2(hass):
     assert active.entity_id == "zone.smallest_zone"
 
 
+async def test_active_zone_prefers_nested_zone(hass):
+    """Test a zone inside a bigger zone wins when it is closer."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {
+            "zone": [
+                {
+                    "name": "Big Zone",
+                    "latitude": 32.880600,
+                    "longitude": -117.237561,
+                    "radius": 1000,
+                },
+                {
+                    "name": "Room",
+                    "latitude": 32.881000,
+                    "longitude": -117.237561,
+                    "radius": 10,
+                },
+            ]
+        },
+    )
+
+    active = zone.async_active_zone(hass, 32.881000, -117.237561)
+    assert active.entity_id == "zone.room"
+
+    active = zone.async_active_zone(hass, 32.880600, -117.237561)
+    assert active.entity_id == "zone.big_zone"
+
+
+async def test_active_zone_breaks_ties_on_entity_id(hass):
+    """Test equally close and big zones resolve to the first entity ID."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {
+            "zone": [
+                {"name": "B", "latitude": 10, "longitude": 9.5, "radius": 100000},
+                {"name": "A", "latitude": 10, "longitude": 10.5, "radius": 100000},
+            ]
+        },
+    )
+
+    active = zone.async_active_zone(hass, 10, 10)
+    assert active.entity_id == "zone.a"
+
+
 async def test_in_zone_works_for_passive_zones(hass):
     """Test working in passive zones."""
     latitude = 32.880600
@@ -222,6 +269,60 @@ async def test_in_zone_works_for_passive_zones(hass):
     assert zone.in_zone(hass.states.get("zone.passive_zone"), latitude, longitude)
 
 
+async def test_in_zone_across_antimeridian(hass):
+    """Test zones that straddle the antimeridian."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {
+            "zone": [
+                {
+                    "name": "Dateline Zone",
+                    "latitude": -16.7,
+                    "longitude": 179.9995,
+                    "radius": 250,
+                }
+            ]
+        },
+    )
+
+    state = hass.states.get("zone.dateline_zone")
+    assert zone.in_zone(state, -16.7, -179.9995)
+    assert not zone.in_zone(state, -16.7, -179.99)
+
+    active = zone.async_active_zone(hass, -16.7, -179.9995)
+    assert active.entity_id == "zone.dateline_zone"
+
+
+async def test_zones_near_the_pole(hass):
+    """Test big zones far from the equator use the exact distance."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {
+            "zone": [
+                {"name": "Pole", "latitude": 89.5, "longitude": 0, "radius": 150000},
+                {"name": "Arctic", "latitude": 80, "longitude": 0, "radius": 765000},
+            ]
+        },
+    )
+
+    assert zone.in_zone(hass.states.get("zone.pole"), 89.5, 180)
+    active = zone.async_active_zone(hass, 89.5, 180)
+    assert active.entity_id == "zone.pole"
+
+    assert zone.in_zone(hass.states.get("zone.arctic"), 80, 40)
+    active = zone.async_active_zone(hass, 80, 40)
+    assert active.entity_id == "zone.arctic"
+
+
+async def test_in_zone_without_location(hass):
+    """Test in_zone is false when the location is not known."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": {}})
+
+    assert not zone.in_zone(hass.states.get("zone.home"), None, None)
+
+
 async def test_core_config_update(hass):
     """Test updating core config will update home zone."""
     assert await setup.async_setup_component(hass, "zone", {})
@@ -429,6 +530,123 @@ async def test_update(hass, hass_ws_client, storage_setup):
     assert state.attributes["passive"] is True
 
 
+async def test_active_zone_follows_updates(hass, hass_ws_client, storage_setup):
+    """Test active zone picks up moved and deleted zones."""
+    items = [
+        {
+            "id": "from_storage",
+            "name": "from storage",
+            "latitude": 1,
+            "longitude": 2,
+            "radius": 100,
+            "passive": False,
+        }
+    ]
+    assert await storage_setup(items)
+
+    active = zone.async_active_zone(hass, 1, 2)
+    assert active.entity_id == "zone.from_storage"
+    assert zone.async_active_zone(hass, 3, 4) is None
+
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 6,
+            "type": f"{DOMAIN}/update",
+            f"{DOMAIN}_id": "from_storage",
+            "latitude": 3,
+            "longitude": 4,
+        }
+    )
+    resp = await client.receive_json()
+    assert resp["success"]
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 1, 2) is None
+    active = zone.async_active_zone(hass, 3, 4)
+    assert active.entity_id == "zone.from_storage"
+
+    await client.send_json(
+        {"id": 7, "type": f"{DOMAIN}/delete", f"{DOMAIN}_id": "from_storage"}
+    )
+    resp = await client.receive_json()
+    assert resp["success"]
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 3, 4) is None
+
+
+async def test_active_zone_matches_state_machine(hass):
+    """Test active zone sees zone entity changes without waiting for events."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {"zone": {"name": "A", "latitude": 10, "longitude": 10, "radius": 1000}},
+    )
+    item = await hass.data[DOMAIN].async_create_item(
+        {"name": "B", "latitude": 20, "longitude": 20, "radius": 1000}
+    )
+    await hass.async_block_till_done()
+    zone_b = hass.data[zone.DATA_ZONE_ENTITIES]["b"]
+
+    await zone_b.async_update_config(
+        {**item, "latitude": 10, "longitude": 10, "radius": 500}
+    )
+    assert zone.async_active_zone(hass, 20, 20) is None
+    assert zone.async_active_zone(hass, 10, 10).entity_id == "zone.b"
+
+    await zone_b.async_update_config({**item, "passive": True})
+    assert zone.async_active_zone(hass, 20, 20) is None
+
+    await zone_b.async_update_config(item)
+    assert zone.async_active_zone(hass, 20, 20).entity_id == "zone.b"
+
+    await zone_b.async_remove()
+    assert zone.async_active_zone(hass, 20, 20) is None
+
+
+async def test_active_zone_rechecks_zone_states(hass):
+    """Test active zone does not return a zone state changed by others."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {"zone": {"name": "A", "latitude": 10, "longitude": 10, "radius": 1000}},
+    )
+
+    attrs = {"latitude": 20, "longitude": 20, "radius": 1000}
+    hass.states.async_set("zone.b", "0", attrs)
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 20, 20).entity_id == "zone.b"
+
+    hass.states.async_set("zone.b", "0", {**attrs, "passive": True})
+    assert zone.async_active_zone(hass, 20, 20) is None
+
+    hass.states.async_set("zone.b", "0", attrs)
+    await hass.async_block_till_done()
+    hass.states.async_set(
+        "zone.b", "0", {**attrs, "latitude": 10, "longitude": 10, "radius": 500}
+    )
+    assert zone.async_active_zone(hass, 20, 20) is None
+    assert zone.async_active_zone(hass, 10, 10).entity_id == "zone.b"
+
+    hass.states.async_remove("zone.b")
+    assert zone.async_active_zone(hass, 10, 10).entity_id == "zone.a"
+
+
+async def test_active_zone_skips_incomplete_zone(hass):
+    """Test a zone state missing its geometry is not used."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": {}})
+
+    attrs = {"latitude": 20, "longitude": 20, "radius": 1000}
+    hass.states.async_set("zone.b", "0", attrs)
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 20, 20).entity_id == "zone.b"
+
+    hass.states.async_set("zone.b", "0", {"latitude": 20, "longitude": 20})
+    assert zone.async_active_zone(hass, 20, 20) is None
+
+
 async def test_ws_create(hass, hass_ws_client, storage_setup):
     """Test create WS."""
     assert await storage_setup(items=[])